@@ -3,10 +3,13 @@ import logging
 import os
 import re
 import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from langsmith import evaluate
 
+from rag_evaluation_framework.evaluation.cache.semantic_cache import SemanticResultCache
 from rag_evaluation_framework.evaluation.chunker.base import Chunker
 from rag_evaluation_framework.evaluation.metrics.base import Metrics
 from rag_evaluation_framework.evaluation.vector_store.base import VectorStore
@@ -102,6 +105,7 @@ class Evaluation:
         vector_store: VectorStore,
         k: int,
         reranker: Optional[Reranker] = None,
+        retrieval_cache: Optional[SemanticResultCache] = None,
     ) -> List[dict]:
         """Run retrieval for a single query."""
         query = input.get(self.query_field, "")
@@ -116,8 +120,17 @@ class Evaluation:
         )
 
         query_embedding = embedder.embed_docs([query])[0]
-        retrieved_chunks = vector_store.search(query_embedding, k)
-        logger.debug("Retrieved %d chunks from vector store", len(retrieved_chunks))
+        cached_chunks = (
+            retrieval_cache.get(query_embedding, k) if retrieval_cache else None
+        )
+        if cached_chunks is not None:
+            retrieved_chunks = cached_chunks
+            logger.debug("Reused %d cached chunks", len(retrieved_chunks))
+        else:
+            retrieved_chunks = vector_store.search(query_embedding, k)
+            logger.debug("Retrieved %d chunks from vector store", len(retrieved_chunks))
+            if retrieval_cache is not None:
+                retrieval_cache.put(query_embedding, retrieved_chunks, k)
 
         if reranker:
             logger.debug("Applying reranker")
@@ -160,59 +173,81 @@ class Evaluation:
     #  Internal pipeline stages (used by both run and sweep)               #
     # ------------------------------------------------------------------ #
 
+    @staticmethod
+    def _process_kb_file(
+        file_path: Path, chunker: Chunker, embedder: Embedder
+    ) -> Dict[str, Any]:
+        """Chunk and embed a single KB document.
+
+        A staticmethod so it can be shipped to worker processes.
+        """
+        logger.debug("Processing file: %s", file_path.name)
+        with open(file_path, "r", encoding="utf-8") as file:
+            post = frontmatter.load(file)
+        markdown_content = post.content
+        metadata_value = dict(post.metadata) if post.metadata else {}
+
+        doc_id = file_path.name
+        base_metadata = {
+            k: v
+            for k, v in metadata_value.items()
+            if isinstance(v, (str, int, float, bool))
+        }
+        base_metadata["doc_id"] = doc_id
+
+        chunk_batch = chunker.chunk_batch(markdown_content)
+        logger.debug("Created %d chunks from %s", len(chunk_batch), file_path.name)
+        chunk_texts = chunk_batch.texts
+        embeddings = embedder.embed_docs(chunk_texts)
+        metadatas = [
+            {
+                **base_metadata,
+                "start_index": start_index,
+                "end_index": end_index,
+            }
+            for start_index, end_index in zip(
+                chunk_batch.starts.tolist(), chunk_batch.ends.tolist()
+            )
+        ]
+        doc_ids = [str(uuid.uuid4()) for _ in chunk_texts]
+
+        return {
+            "texts": chunk_texts,
+            "embeddings": embeddings,
+            "metadatas": metadatas,
+            "doc_ids": doc_ids,
+        }
+
     def _process_kb(
-        self, chunker: Chunker, embedder: Embedder
+        self,
+        chunker: Chunker,
+        embedder: Embedder,
+        max_concurrency: int = 4,
+        concurrency_mode: str = "thread",
     ) -> List[Dict[str, Any]]:
         """Chunk and embed all KB documents.
 
         Returns a list of batches (one per file), each containing texts,
-        embeddings, metadatas, and doc_ids ready to be indexed.
+        embeddings, metadatas, and doc_ids ready to be indexed.  Files are
+        processed concurrently: threads suit API-bound embedders, processes
+        suit CPU-bound chunkers/embedders (which must then be picklable).
         """
         kb_markdown_files_path = self.__get_kb_files_path()
-        processed: List[Dict[str, Any]] = []
-        total_chunks = 0
-
-        for file_path in kb_markdown_files_path:
-            logger.debug("Processing file: %s", file_path.name)
-            with open(file_path, "r", encoding="utf-8") as file:
-                post = frontmatter.load(file)
-                markdown_content = post.content
-                metadata_value = dict(post.metadata) if post.metadata else {}
-
-                doc_id = file_path.name
-                base_metadata = {
-                    k: v
-                    for k, v in metadata_value.items()
-                    if isinstance(v, (str, int, float, bool))
-                }
-                base_metadata["doc_id"] = doc_id
-
-                chunked_docs = chunker.chunk(markdown_content)
-                logger.debug(
-                    "Created %d chunks from %s", len(chunked_docs), file_path.name
-                )
-                chunk_texts = [chunk.text for chunk in chunked_docs]
-                embeddings = embedder.embed_docs(chunk_texts)
-                metadatas = [
-                    {
-                        **base_metadata,
-                        "start_index": chunk.start_index,
-                        "end_index": chunk.end_index,
-                    }
-                    for chunk in chunked_docs
-                ]
-                doc_ids = [str(uuid.uuid4()) for _ in chunked_docs]
-
-                processed.append(
-                    {
-                        "texts": chunk_texts,
-                        "embeddings": embeddings,
-                        "metadatas": metadatas,
-                        "doc_ids": doc_ids,
-                    }
+
+        executor_cls = (
+            ProcessPoolExecutor if concurrency_mode == "process" else ThreadPoolExecutor
+        )
+        with executor_cls(max_workers=max(1, max_concurrency)) as executor:
+            processed = list(
+                executor.map(
+                    self._process_kb_file,
+                    kb_markdown_files_path,
+                    repeat(chunker),
+                    repeat(embedder),
                 )
-                total_chunks += len(chunked_docs)
+            )
 
+        total_chunks = sum(len(batch["texts"]) for batch in processed)
         logger.info(
             "Knowledge base processed: %d total chunks from %d files",
             total_chunks,
@@ -240,8 +275,13 @@ class Evaluation:
         k: int,
         reranker: Optional[Reranker],
         config: Optional[EvaluationConfig],
+        retrieval_cache: Optional[SemanticResultCache] = None,
     ) -> Dict[str, Any]:
-        """Run retrieval evaluation against the LangSmith dataset and extract metrics."""
+        """Run retrieval evaluation against the LangSmith dataset and extract metrics.
+
+        ``retrieval_cache`` lets queries similar to ones already retrieved
+        against the same indexed KB skip the vector store search.
+        """
         langsmith_evaluators = get_langsmith_evaluators(metrics, k)
 
         experiment_prefix = config.experiment_prefix if config else ""
@@ -256,7 +296,7 @@ class Evaluation:
 
         results = evaluate(
             lambda input: self.__run_retrieval(
-                input, embedder, vector_store, k, reranker
+                input, embedder, vector_store, k, reranker, retrieval_cache
             ),
             data=self.langsmith_dataset_name,
             evaluators=langsmith_evaluators,
@@ -465,10 +505,22 @@ class Evaluation:
             metrics = self.__get_default_metrics()
             logger.debug("Using default metrics: %s", list(metrics.keys()))
 
-        processed_kb = self._process_kb(chunker, embedder)
+        processed_kb = self._process_kb(
+            chunker,
+            embedder,
+            max_concurrency=config.max_concurrency if config else 4,
+            concurrency_mode=config.concurrency_mode if config else "thread",
+        )
         self._index_kb(processed_kb, vector_store)
+
+        retrieval_cache = None
+        if config and config.retrieval_cache_threshold is not None:
+            retrieval_cache = SemanticResultCache(
+                threshold=config.retrieval_cache_threshold
+            )
+
         return self._evaluate_retrieval(
-            embedder, vector_store, metrics, k, reranker, config
+            embedder, vector_store, metrics, k, reranker, config, retrieval_cache
         )
 
     def sweep(self, sweep_config: SweepConfig) -> List[Dict[str, Any]]:
@@ -518,7 +570,20 @@ class Evaluation:
                     chunker_label,
                     embedder_label,
                 )
-                processed_kb = self._process_kb(chunker, embedder)
+                processed_kb = self._process_kb(
+                    chunker,
+                    embedder,
+                    max_concurrency=sweep_config.max_concurrency,
+                    concurrency_mode=sweep_config.concurrency_mode,
+                )
+
+                # Every (k, reranker) cell of this pair searches the same
+                # indexed KB, so one retrieval cache is shared across them.
+                retrieval_cache = None
+                if sweep_config.retrieval_cache_threshold is not None:
+                    retrieval_cache = SemanticResultCache(
+                        threshold=sweep_config.retrieval_cache_threshold
+                    )
 
                 for k in k_values:
                     for reranker in rerankers:
@@ -547,10 +612,17 @@ class Evaluation:
                             experiment_prefix=prefix,
                             description=f"Sweep: {prefix}",
                             max_concurrency=sweep_config.max_concurrency,
+                            concurrency_mode=sweep_config.concurrency_mode,
                         )
 
                         result = self._evaluate_retrieval(
-                            embedder, vector_store, metrics, k, reranker, config
+                            embedder,
+                            vector_store,
+                            metrics,
+                            k,
+                            reranker,
+                            config,
+                            retrieval_cache,
                         )
 
                         result["config"] = {
@@ -0,0 +1,3 @@
+from .semantic_cache import SemanticResultCache
+
+__all__ = ["SemanticResultCache"]
@@ -0,0 +1,153 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Rounding slack for the dot product of two normalised vectors, so that an
+# identical embedding still hits at threshold=1.0.
+_SIMILARITY_TOLERANCE = 1e-6
+
+
+class SemanticResultCache:
+    """
+    Cache of retrieval results keyed by query embedding similarity.
+
+    A lookup hits when a stored query embedding has cosine similarity of at
+    least ``threshold`` with the new one and was retrieved with at least the
+    requested ``k`` (the cached list is truncated to ``k``). Embeddings are
+    L2-normalised and kept in one matrix, so a lookup is a single
+    inner-product scan. Entries are evicted least-recently-used beyond
+    ``max_size`` and, if a TTL is set, once expired.
+
+    Hits with ``threshold < 1.0`` reuse results for *paraphrased* queries,
+    which changes what is measured; keep the threshold high for evaluation.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_size: int = 4096,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            threshold: Minimum cosine similarity for a cache hit.
+            max_size: Maximum number of cached queries.
+            ttl: Default time-to-live in seconds for entries. None means no expiry.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._embeddings: Optional[np.ndarray] = None
+        self._ks = np.zeros(0, dtype=np.int64)
+        self._expires_at = np.zeros(0, dtype=np.float64)
+        self._results: List[Optional[List[Dict[str, Any]]]] = []
+        # slot -> None, ordered from least to most recently used
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float64)
+        norm = np.linalg.norm(vector)
+        if vector.ndim != 1 or norm == 0:
+            return None
+        return vector / norm
+
+    def _grow(self, dim: int) -> None:
+        capacity = 0 if self._embeddings is None else len(self._embeddings)
+        new_capacity = min(self.max_size, max(16, capacity * 2))
+        embeddings = np.zeros((new_capacity, dim), dtype=np.float64)
+        ks = np.zeros(new_capacity, dtype=np.int64)
+        expires_at = np.full(new_capacity, -np.inf)
+        if self._embeddings is not None:
+            embeddings[:capacity] = self._embeddings
+            ks[:capacity] = self._ks
+            expires_at[:capacity] = self._expires_at
+        self._embeddings, self._ks, self._expires_at = embeddings, ks, expires_at
+        self._results.extend([None] * (new_capacity - capacity))
+
+    def get(self, query_embedding: List[float], k: int) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for a similar query, or None on a miss."""
+        query = self._normalize(query_embedding)
+        with self._lock:
+            if query is None or not self._lru:
+                return None
+            if len(query) != self._embeddings.shape[1]:
+                return None
+
+            scores = self._embeddings @ query
+            scores[self._ks < k] = -np.inf
+            scores[self._expires_at <= time.monotonic()] = -np.inf
+            slot = int(np.argmax(scores))
+            if scores[slot] < self.threshold - _SIMILARITY_TOLERANCE:
+                return None
+
+            self._lru.move_to_end(slot)
+            logger.debug("Semantic cache hit (similarity=%.4f)", float(scores[slot]))
+            return list(self._results[slot][:k])
+
+    def put(
+        self,
+        query_embedding: List[float],
+        results: List[Dict[str, Any]],
+        k: int,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Store ``results`` retrieved with ``k`` for ``query_embedding``."""
+        query = self._normalize(query_embedding)
+        if query is None:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            # Same as a miss in get(): a mismatched embedding is just not cached.
+            if self._embeddings is not None and len(query) != self._embeddings.shape[1]:
+                logger.debug(
+                    "Skipping semantic cache put: embedding dimension %d does not match cache dimension %d",
+                    len(query),
+                    self._embeddings.shape[1],
+                )
+                return
+
+            if len(self._lru) < self.max_size:
+                if self._embeddings is None or len(self._lru) == len(self._embeddings):
+                    self._grow(len(query))
+                slot = len(self._lru)
+            else:
+                # Reclaim an expired slot before evicting a live entry.
+                expired = np.flatnonzero(self._expires_at <= time.monotonic())
+                if len(expired):
+                    slot = int(expired[0])
+                    del self._lru[slot]
+                else:
+                    slot, _ = self._lru.popitem(last=False)
+
+            self._embeddings[slot] = query
+            self._ks[slot] = k
+            self._expires_at[slot] = np.inf if ttl is None else time.monotonic() + ttl
+            self._results[slot] = list(results)
+            self._lru[slot] = None
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._embeddings = None
+            self._ks = np.zeros(0, dtype=np.int64)
+            self._expires_at = np.zeros(0, dtype=np.float64)
+            self._results = []
+            self._lru.clear()
+
+    def __len__(self) -> int:
+        """Number of live (unexpired) entries."""
+        with self._lock:
+            if not self._lru:
+                return 0
+            return int(np.count_nonzero(self._expires_at[: len(self._lru)] > time.monotonic()))
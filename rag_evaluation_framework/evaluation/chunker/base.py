@@ -1,14 +1,61 @@
 from abc import ABC, abstractmethod
-from typing import List
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Iterator, List
 
-class Chunk(BaseModel):
+import numpy as np
+
+@dataclass(slots=True, frozen=True)
+class Chunk:
     text: str
     start_index: int
     end_index: int
 
+@dataclass(slots=True, eq=False)
+class ChunkBatch:
+    """Chunks of one document stored column-wise (texts + offset arrays).
+
+    Bulk consumers (embedding, indexing) read ``texts`` and the int32
+    ``starts``/``ends`` arrays directly instead of touching each ``Chunk``.
+    Iterating yields ``Chunk`` objects for code expecting ``List[Chunk]``.
+    """
+    texts: List[str]
+    starts: np.ndarray
+    ends: np.ndarray
+
+    @classmethod
+    def from_chunks(cls, chunks: List[Chunk]) -> "ChunkBatch":
+        return cls(
+            texts=[chunk.text for chunk in chunks],
+            starts=np.fromiter((chunk.start_index for chunk in chunks), dtype=np.int32, count=len(chunks)),
+            ends=np.fromiter((chunk.end_index for chunk in chunks), dtype=np.int32, count=len(chunks)),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ would compare the arrays elementwise.
+        if not isinstance(other, ChunkBatch):
+            return NotImplemented
+        return (
+            self.texts == other.texts
+            and np.array_equal(self.starts, other.starts)
+            and np.array_equal(self.ends, other.ends)
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[Chunk]:
+        for text, start, end in zip(self.texts, self.starts.tolist(), self.ends.tolist()):
+            yield Chunk(text=text, start_index=start, end_index=end)
+
 class Chunker(ABC):
 
     @abstractmethod
     def chunk(self, text: str) -> List[Chunk]:
         raise NotImplementedError
+
+    def chunk_batch(self, text: str) -> ChunkBatch:
+        """Chunk ``text`` into a column-oriented ``ChunkBatch``.
+
+        The default wraps ``chunk``; override to build the arrays directly.
+        """
+        return ChunkBatch.from_chunks(self.chunk(text))
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 
 from pydantic import BaseModel, ConfigDict
 
@@ -12,6 +12,8 @@ class EvaluationConfig(BaseModel):
     experiment_prefix: str = ""
     description: str = ""
     max_concurrency: int = 4
+    concurrency_mode: Literal["thread", "process"] = "thread"
+    retrieval_cache_threshold: Optional[float] = None
     save_results: bool = False
     save_results_path: str = ""
 
@@ -31,7 +33,16 @@ class SweepConfig(BaseModel):
         rerankers: List of reranker instances (use None for no reranking).
         metrics: Metrics to compute for every experiment. If not provided, all default
                  token-level metrics are used.
-        max_concurrency: Max concurrent queries within each LangSmith evaluation run.
+        max_concurrency: Max concurrent queries within each LangSmith evaluation run,
+                         and max workers used to chunk and embed KB files.
+        concurrency_mode: ``"thread"`` (default) or ``"process"`` workers for KB
+                          processing. Process mode requires picklable chunkers
+                          and embedders.
+        retrieval_cache_threshold: If set, queries whose embedding has at least this
+                                   cosine similarity with an earlier query (same
+                                   chunker/embedder) reuse its retrieved chunks
+                                   instead of searching the vector store again.
+                                   ``None`` (default) disables the cache.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -42,3 +53,5 @@ class SweepConfig(BaseModel):
     rerankers: Optional[List[Optional[Reranker]]] = None
     metrics: Optional[Dict[str, Metrics]] = None
     max_concurrency: int = 4
+    concurrency_mode: Literal["thread", "process"] = "thread"
+    retrieval_cache_threshold: Optional[float] = None
@@ -1,8 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 class Embedder(ABC):
 
     @abstractmethod
     def embed_docs(self, docs: List[str]) -> List[List[float]]:
         raise NotImplementedError
+
+    def embed_docs_batched(self, docs: List[str], batch_size: int = 32) -> List[List[float]]:
+        """Embed ``docs`` in length-sorted batches of ``batch_size``.
+
+        Grouping documents of similar length minimises padding for backends
+        that batch internally. Embeddings are returned in the input order.
+        Override to use a backend's native batching API.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        order = sorted(range(len(docs)), key=lambda i: len(docs[i]))
+        embeddings: List[Optional[List[float]]] = [None] * len(docs)
+        for start in range(0, len(order), batch_size):
+            batch_idx = order[start:start + batch_size]
+            batch_embeddings = self.embed_docs([docs[i] for i in batch_idx])
+            for i, embedding in zip(batch_idx, batch_embeddings):
+                embeddings[i] = embedding
+        return embeddings  # type: ignore[return-value]
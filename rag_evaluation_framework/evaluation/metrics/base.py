@@ -1,9 +1,39 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Callable, Any
+from collections import OrderedDict
+from typing import List, Dict, Optional, Callable, Any, Hashable
 from langsmith import EvaluationResult
 from langsmith.schemas import Example, Run
 
+
+class _LRUCache:
+    """Small thread-safe LRU map; LangSmith runs evaluators concurrently."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
 class Metrics(ABC):
+    # Ground truth is memoised per LangSmith example version, so a sweep that
+    # reuses one metric instance across experiments only prepares it once.
+    ground_truth_cache_size: int = 4096
+
     @abstractmethod
     def calculate(self, retrieved_chunk_ids: List[Any], ground_truth_chunk_ids: List[Any]) -> float:
         raise NotImplementedError
@@ -16,6 +46,34 @@ class Metrics(ABC):
     def extract_retrieved_chunks_ids(self, run: Run) -> List[Any]:
         raise NotImplementedError
 
+    def _prepare_ground_truth(self, example: Optional[Example]) -> Any:
+        """Value passed to ``calculate`` as ground truth; cached per example."""
+        return self.extract_ground_truth_chunks_ids(example)
+
+    def _get_ground_truth(self, example: Optional[Example]) -> Any:
+        # modified_at changes whenever the example is edited in LangSmith, so
+        # keying on it means a rerun after an edit never scores stale ground
+        # truth. Without it an edit is undetectable, so nothing is cached.
+        example_id = getattr(example, "id", None)
+        modified_at = getattr(example, "modified_at", None)
+        if example_id is None or modified_at is None or self.ground_truth_cache_size <= 0:
+            return self._prepare_ground_truth(example)
+
+        # Created lazily so subclasses need not call super().__init__().
+        cache = self.__dict__.get("_ground_truth_cache")
+        if cache is None:
+            cache = self.__dict__.setdefault(
+                "_ground_truth_cache", _LRUCache(self.ground_truth_cache_size)
+            )
+
+        key = (example_id, modified_at)
+        missing = object()
+        ground_truth = cache.get(key, missing)
+        if ground_truth is missing:
+            ground_truth = self._prepare_ground_truth(example)
+            cache.put(key, ground_truth)
+        return ground_truth
+
     def to_langsmith_evaluator(self, metric_name: Optional[str] = None, k: Optional[int] = None) -> Callable[[Run, Optional[Example]], EvaluationResult]:
 
         name = metric_name or self.__class__.__name__
@@ -25,7 +83,7 @@ class Metrics(ABC):
 
         def evaluator(run: Run, example: Optional[Example]) -> EvaluationResult:
             retrieved_chunks_ids = self.extract_retrieved_chunks_ids(run)
-            ground_truth_chunks_ids = self.extract_ground_truth_chunks_ids(example)
+            ground_truth_chunks_ids = self._get_ground_truth(example)
 
 
 
@@ -37,5 +95,3 @@ class Metrics(ABC):
             )
 
         return evaluator
-
-        
\ No newline at end of file
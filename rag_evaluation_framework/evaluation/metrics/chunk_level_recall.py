@@ -1,68 +1,127 @@
 import logging
 from rag_evaluation_framework.evaluation.metrics.base import Metrics
-from typing import List, Optional
+from typing import AbstractSet, Callable, Collection, List, Optional
 from langsmith.schemas import Example, Run
 
 logger = logging.getLogger(__name__)
 
 class ChunkLevelRecall(Metrics):
-    def calculate(self, retrieved_chunk_ids: List[str], ground_truth_chunk_ids: List[str]) -> float:
-        logger.debug(
-            "Calculating chunk-level recall with retrieved=%d, ground_truth=%d",
-            len(retrieved_chunk_ids),
-            len(ground_truth_chunk_ids),
-        )
-        logger.debug("Retrieved chunk IDs: %s", retrieved_chunk_ids)
-        logger.debug("Ground truth chunk IDs: %s", ground_truth_chunk_ids)
-        retrieved_chunk_ids_set = set(retrieved_chunk_ids)
-        ground_truth_chunk_ids_set = set(ground_truth_chunk_ids)
+    @staticmethod
+    def calculate_from_sets(retrieved_chunk_ids_set: AbstractSet[str], ground_truth_chunk_ids_set: AbstractSet[str]) -> float:
+        """Recall from prebuilt id sets.
 
-        if len(ground_truth_chunk_ids_set) == 0 or len(retrieved_chunk_ids_set) == 0:
-            logger.debug("Empty retrieved or ground truth set; returning 0.0")
+        Callers scoring several set-based metrics on one example can build the
+        two sets once and pass them to each metric.
+        """
+        if not ground_truth_chunk_ids_set or not retrieved_chunk_ids_set:
+            return 0.0
+        # Subset and disjoint tests allocate nothing and cover the common
+        # all-or-nothing outcomes.
+        if ground_truth_chunk_ids_set <= retrieved_chunk_ids_set:
+            return 1.0
+        if ground_truth_chunk_ids_set.isdisjoint(retrieved_chunk_ids_set):
             return 0.0
+        return len(retrieved_chunk_ids_set & ground_truth_chunk_ids_set) / len(ground_truth_chunk_ids_set)
 
-        score = len(retrieved_chunk_ids_set & ground_truth_chunk_ids_set) / len(ground_truth_chunk_ids_set)
-        logger.debug("Chunk-level recall score: %s", score)
+    def calculate(self, retrieved_chunk_ids: List[str], ground_truth_chunk_ids: List[str]) -> float:
+        # Metrics run once per example per experiment, so debug output is
+        # guarded to keep argument formatting off the hot path.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Calculating chunk-level recall with retrieved=%d, ground_truth=%d",
+                len(retrieved_chunk_ids),
+                len(ground_truth_chunk_ids),
+            )
+            logger.debug("Retrieved chunk IDs: %s", retrieved_chunk_ids)
+            logger.debug("Ground truth chunk IDs: %s", ground_truth_chunk_ids)
+
+        # Ground truth prepared by _prepare_ground_truth is already a frozenset.
+        score = self.calculate_from_sets(
+            frozenset(retrieved_chunk_ids),
+            ground_truth_chunk_ids if isinstance(ground_truth_chunk_ids, frozenset) else frozenset(ground_truth_chunk_ids),
+        )
+        if debug:
+            logger.debug("Chunk-level recall score: %s", score)
         return score
 
+    @staticmethod
+    def specialized(k: int, expected_gt_size: int) -> Callable[[List[str], Collection[str]], float]:
+        """Return a recall function specialised for a fixed ``k``.
+
+        The iteration strategy is chosen once per sweep cell instead of per
+        call: when ``k`` is smaller than the expected ground truth, retrieved
+        ids are probed against the ground truth set; otherwise the (at most
+        ``k``) retrieved ids are hashed and the ground truth is probed.
+        Ground truth may be any collection; a frozenset is used as-is.
+        """
+        if k < expected_gt_size:
+            def calculate(retrieved_chunk_ids: List[str], ground_truth_chunk_ids: Collection[str]) -> float:
+                gt_set = ground_truth_chunk_ids if isinstance(ground_truth_chunk_ids, frozenset) else frozenset(ground_truth_chunk_ids)
+                if not gt_set:
+                    return 0.0
+                return len(gt_set.intersection(retrieved_chunk_ids)) / len(gt_set)
+        else:
+            def calculate(retrieved_chunk_ids: List[str], ground_truth_chunk_ids: Collection[str]) -> float:
+                gt_set = ground_truth_chunk_ids if isinstance(ground_truth_chunk_ids, frozenset) else frozenset(ground_truth_chunk_ids)
+                if not gt_set:
+                    return 0.0
+                retrieved_set = set(retrieved_chunk_ids)
+                return sum(1 for chunk_id in gt_set if chunk_id in retrieved_set) / len(gt_set)
+        return calculate
+
+    def _prepare_ground_truth(self, example: Optional[Example]) -> frozenset:
+        return frozenset(self.extract_ground_truth_chunks_ids(example))
+
     def extract_ground_truth_chunks_ids(self, example: Optional[Example]) -> List[str]:
         """Extract ground truth chunk IDs from Langsmith Example."""
+        debug = logger.isEnabledFor(logging.DEBUG)
         if example is None:
-            logger.debug("No example provided; ground truth chunk IDs empty")
+            if debug:
+                logger.debug("No example provided; ground truth chunk IDs empty")
             return []
         
-        logger.debug("Extracting ground truth chunk IDs from example: %s", type(example).__name__)
-        if hasattr(example, "outputs"):
-            logger.debug("Example outputs type: %s", type(example.outputs).__name__)
-            logger.debug("Example outputs: %s", example.outputs)
+        outputs = getattr(example, "outputs", None)
+        if debug:
+            logger.debug("Extracting ground truth chunk IDs from example: %s", type(example).__name__)
+            logger.debug("Example outputs type: %s", type(outputs).__name__)
+            logger.debug("Example outputs: %s", outputs)
         
         # Try to get chunk_ids from outputs
-        if hasattr(example, 'outputs') and example.outputs:
-            if isinstance(example.outputs, dict):
-                chunk_ids = example.outputs.get("chunk_ids", [])
-                logger.debug("Ground truth chunk IDs from outputs['chunk_ids']: %s", chunk_ids)
+        if outputs:
+            if isinstance(outputs, dict):
+                chunk_ids = outputs.get("chunk_ids", [])
+                if debug:
+                    logger.debug("Ground truth chunk IDs from outputs['chunk_ids']: %s", chunk_ids)
                 return chunk_ids
-            elif isinstance(example.outputs, list):
-                logger.debug("Ground truth chunk IDs from outputs list: %s", example.outputs)
-                return example.outputs
+            elif isinstance(outputs, list):
+                if debug:
+                    logger.debug("Ground truth chunk IDs from outputs list: %s", outputs)
+                return outputs
         
-        logger.debug("No ground truth chunk IDs found in example outputs")
+        if debug:
+            logger.debug("No ground truth chunk IDs found in example outputs")
         return []
 
     def extract_retrieved_chunks_ids(self, run: Run) -> List[str]:
         """Extract retrieved chunk IDs from Langsmith Run."""
-        if hasattr(run, 'outputs'):
-            logger.debug("Extracting retrieved chunk IDs from run outputs type: %s", type(run.outputs).__name__)
-            logger.debug("Run outputs: %s", run.outputs)
-            # The outputs should be a list of strings (chunks) from __run_retrieval
-            if isinstance(run.outputs, list):
-                logger.debug("Retrieved chunk IDs from outputs list: %s", run.outputs)
-                return run.outputs
-            elif isinstance(run.outputs, dict):
-                # If outputs is a dict, try to get chunks or retrieved_chunks
-                chunk_ids = run.outputs.get("chunks", run.outputs.get("retrieved_chunks", []))
+        debug = logger.isEnabledFor(logging.DEBUG)
+        outputs = getattr(run, "outputs", None)
+        if debug:
+            logger.debug("Extracting retrieved chunk IDs from run outputs type: %s", type(outputs).__name__)
+            logger.debug("Run outputs: %s", outputs)
+        # The outputs should be a list of strings (chunks) from __run_retrieval
+        if isinstance(outputs, list):
+            if debug:
+                logger.debug("Retrieved chunk IDs from outputs list: %s", outputs)
+            return outputs
+        elif isinstance(outputs, dict):
+            # If outputs is a dict, try to get chunks or retrieved_chunks
+            chunk_ids = outputs.get("chunks", outputs.get("retrieved_chunks", []))
+            if debug:
                 logger.debug("Retrieved chunk IDs from outputs dict: %s", chunk_ids)
-                return chunk_ids
+            return chunk_ids
         
-        logger.debug("No retrieved chunk IDs found in run outputs")
-        return []
\ No newline at end of file
+        if debug:
+            logger.debug("No retrieved chunk IDs found in run outputs")
+        return []
@@ -1,6 +1,7 @@
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 import logging
 
+import numpy as np
 from langsmith.schemas import Example, Run
 
 from rag_evaluation_framework.evaluation.metrics.base import Metrics
@@ -8,11 +9,48 @@ from rag_evaluation_framework.evaluation.metrics.base import Metrics
 logger = logging.getLogger(__name__)
 
 
+class _GroundTruthSpans(list):
+    """
+    Ground-truth spans together with their per-doc unioned ranges.
+
+    Still a plain list of span dicts, so ``calculate`` accepts it like any
+    other ground truth; the unions are what the evaluator caches.
+    """
+
+    __slots__ = ("union_by_doc",)
+
+    def __init__(
+        self,
+        spans: Iterable[Dict[str, Any]],
+        union_by_doc: Dict[str, List[Tuple[int, int]]],
+    ):
+        super().__init__(spans)
+        self.union_by_doc = union_by_doc
+
+
 class TokenLevelSpanMetric(Metrics):
     """
     Shared span-based helpers for token-level metrics.
     """
 
+    def _prepare_ground_truth(self, example: Optional[Example]) -> _GroundTruthSpans:
+        spans = self.extract_ground_truth_chunks_ids(example)
+        return _GroundTruthSpans(spans, self._ground_truth_unions(spans))
+
+    def _ground_truth_unions(
+        self, ground_truth_chunk_ids: List[Dict[str, Any]]
+    ) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Unioned ranges per doc_id, reused from ``_prepare_ground_truth`` when
+        the evaluator passes prepared ground truth.
+        """
+        if isinstance(ground_truth_chunk_ids, _GroundTruthSpans):
+            return ground_truth_chunk_ids.union_by_doc
+        return {
+            doc_id: self._union_ranges(ranges)
+            for doc_id, ranges in self._ranges_by_doc(ground_truth_chunk_ids).items()
+        }
+
     def _preview(self, value: Any, limit: int = 2000) -> str:
         """
         Return a bounded string preview for logging.
@@ -52,6 +90,25 @@ class TokenLevelSpanMetric(Metrics):
     def _sum_ranges(self, ranges: Iterable[Tuple[int, int]]) -> int:
         return sum(end - start for start, end in ranges)
 
+    def _overlap_len(
+        self, union1: List[Tuple[int, int]], union2: List[Tuple[int, int]]
+    ) -> int:
+        """
+        Total overlap between two sorted, disjoint range lists (as returned by
+        ``_union_ranges``), found with a single linear merge.
+        """
+        overlap = 0
+        i = j = 0
+        while i < len(union1) and j < len(union2):
+            start1, end1 = union1[i]
+            start2, end2 = union2[j]
+            overlap += max(0, min(end1, end2) - max(start1, start2))
+            if end1 < end2:
+                i += 1
+            else:
+                j += 1
+        return overlap
+
     def _ranges_by_doc(self, items: List[Dict[str, Any]]) -> Dict[str, List[Tuple[int, int]]]:
         ranges_by_doc: Dict[str, List[Tuple[int, int]]] = {}
         for item in items:
@@ -67,96 +124,150 @@ class TokenLevelSpanMetric(Metrics):
                 )
                 continue
             ranges_by_doc.setdefault(str(doc_id), []).append((int(start), int(end)))
-        logger.debug(
-            "Built ranges_by_doc: docs=%d total_ranges=%d",
-            len(ranges_by_doc),
-            sum(len(ranges) for ranges in ranges_by_doc.values()),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Built ranges_by_doc: docs=%d total_ranges=%d",
+                len(ranges_by_doc),
+                sum(len(ranges) for ranges in ranges_by_doc.values()),
+            )
         return ranges_by_doc
 
     def _compute_lengths(
         self,
-        ground_truth_ranges: Dict[str, List[Tuple[int, int]]],
+        ground_truth_unions: Dict[str, List[Tuple[int, int]]],
         retrieved_ranges: Dict[str, List[Tuple[int, int]]],
     ) -> Tuple[int, int, int]:
         total_reference_len = 0
         total_retrieved_len = 0
         total_overlap_len = 0
 
-        for doc_id, ref_ranges in ground_truth_ranges.items():
-            ref_union = self._union_ranges(ref_ranges)
-            total_reference_len += self._sum_ranges(ref_union)
-
-            overlap_ranges: List[Tuple[int, int]] = []
-            for ref_range in ref_ranges:
-                for chunk_range in retrieved_ranges.get(doc_id, []):
-                    intersection = self._intersect_ranges(ref_range, chunk_range)
-                    if intersection is not None:
-                        overlap_ranges.append(intersection)
+        retrieved_unions = {
+            doc_id: self._union_ranges(chunk_ranges)
+            for doc_id, chunk_ranges in retrieved_ranges.items()
+        }
 
-            overlap_union = self._union_ranges(overlap_ranges)
-            total_overlap_len += self._sum_ranges(overlap_union)
+        for doc_id, ref_union in ground_truth_unions.items():
+            total_reference_len += self._sum_ranges(ref_union)
+            total_overlap_len += self._overlap_len(
+                ref_union, retrieved_unions.get(doc_id, [])
+            )
 
-        for doc_id, chunk_ranges in retrieved_ranges.items():
-            chunk_union = self._union_ranges(chunk_ranges)
+        for chunk_union in retrieved_unions.values():
             total_retrieved_len += self._sum_ranges(chunk_union)
 
         return total_reference_len, total_retrieved_len, total_overlap_len
 
+    def _flatten_spans(
+        self, batch: List[List[Dict[str, Any]]], doc_codes: Dict[Any, int]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Flatten a batch of span lists into (example, doc code, start, end)
+        arrays. Raw doc ids are coded through the shared ``doc_codes``
+        defaultdict. Spans with missing fields or ``end <= start`` are dropped.
+        """
+        rows = [
+            (example_idx, doc_id, start, end)
+            for example_idx, items in enumerate(batch)
+            for item in items
+            if (doc_id := item.get("doc_id")) is not None
+            and (start := item.get("start_index")) is not None
+            and (end := item.get("end_index")) is not None
+        ]
+        if not rows:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty, empty
+        examples, doc_ids, starts, ends = zip(*rows)
+        codes = [doc_codes[doc_id] for doc_id in doc_ids]
+        starts_arr = np.asarray(starts).astype(np.int64)
+        ends_arr = np.asarray(ends).astype(np.int64)
+        valid = ends_arr > starts_arr
+        return (
+            np.asarray(examples, dtype=np.int64)[valid],
+            np.asarray(codes, dtype=np.int64)[valid],
+            starts_arr[valid],
+            ends_arr[valid],
+        )
+
+    def _union_lengths(
+        self, groups: np.ndarray, starts: np.ndarray, ends: np.ndarray, n_groups: int
+    ) -> np.ndarray:
+        """
+        Length of the union of ranges in every group, computed for all groups
+        at once. Ranges are sorted by (group, start), rebased so the smallest
+        start is 0 and shifted by ``group * offset`` so a single running max of
+        ends never crosses a group boundary; each range then adds whatever
+        extends past it.
+        """
+        if len(groups) == 0:
+            return np.zeros(n_groups, dtype=np.float64)
+        base = starts.min()
+        offset = ends.max() - base + 1
+        order = np.lexsort((starts, groups))
+        sorted_groups = groups[order]
+        shift = sorted_groups * offset - base
+        shifted_starts = starts[order] + shift
+        shifted_ends = ends[order] + shift
+        covered_until = np.empty_like(shifted_ends)
+        covered_until[0] = shifted_starts[0]
+        np.maximum.accumulate(shifted_ends[:-1], out=covered_until[1:])
+        added = np.maximum(
+            shifted_ends - np.maximum(shifted_starts, covered_until), 0
+        )
+        return np.bincount(sorted_groups, weights=added, minlength=n_groups)
+
     def extract_ground_truth_chunks_ids(self, example: Optional[Example]) -> List[Dict[str, Any]]:
         if example is None:
             logger.debug("No example provided for ground truth extraction")
             return []
 
-        logger.debug(
-            "Example inputs preview: %s",
-            self._preview(getattr(example, "inputs", None)),
-        )
-        logger.debug(
-            "Example outputs preview: %s",
-            self._preview(getattr(example, "outputs", None)),
-        )
+        outputs = getattr(example, "outputs", None)
 
-        if hasattr(example, "outputs") and example.outputs:
-            if isinstance(example.outputs, dict):
+        # _preview() reprs the whole payload, so only build it when DEBUG is on.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Example inputs preview: %s",
+                self._preview(getattr(example, "inputs", None)),
+            )
+            logger.debug("Example outputs preview: %s", self._preview(outputs))
+
+        if outputs:
+            if isinstance(outputs, dict):
                 if (
-                    "doc_id" in example.outputs
-                    and "start_index" in example.outputs
-                    and "end_index" in example.outputs
+                    "doc_id" in outputs
+                    and "start_index" in outputs
+                    and "end_index" in outputs
                 ):
                     logger.debug("Ground truth found in example.outputs span dict")
-                    return [example.outputs]
-                if "references" in example.outputs:
+                    return [outputs]
+                if "references" in outputs:
                     logger.debug("Ground truth found in example.outputs['references']")
-                    return example.outputs["references"]
-                if "ground_truth" in example.outputs:
+                    return outputs["references"]
+                if "ground_truth" in outputs:
                     logger.debug("Ground truth found in example.outputs['ground_truth']")
-                    return example.outputs["ground_truth"]
-                if "spans" in example.outputs:
+                    return outputs["ground_truth"]
+                if "spans" in outputs:
                     logger.debug("Ground truth found in example.outputs['spans']")
-                    return example.outputs["spans"]
-            elif isinstance(example.outputs, list):
+                    return outputs["spans"]
+            elif isinstance(outputs, list):
                 logger.debug("Ground truth found in example.outputs list")
-                return example.outputs
+                return outputs
         logger.debug("No ground truth found in example.outputs")
         return []
 
     def extract_retrieved_chunks_ids(self, run: Run) -> List[Dict[str, Any]]:
-        logger.debug(
-            "Run outputs preview: %s",
-            self._preview(getattr(run, "outputs", None)),
-        )
-        if hasattr(run, "outputs"):
-            if isinstance(run.outputs, list):
-                return self._normalize_retrieved_chunks(run.outputs)
-            if isinstance(run.outputs, dict):
-                if "chunks" in run.outputs:
-                    return self._normalize_retrieved_chunks(run.outputs["chunks"])
-                if "retrieved_chunks" in run.outputs:
-                    return self._normalize_retrieved_chunks(run.outputs["retrieved_chunks"])
-                if "output" in run.outputs:
-                    return self._normalize_retrieved_chunks(run.outputs["output"])
-                return self._normalize_retrieved_chunks(run.outputs.get("chunk_ids", []))
+        outputs = getattr(run, "outputs", None)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Run outputs preview: %s", self._preview(outputs))
+        if isinstance(outputs, list):
+            return self._normalize_retrieved_chunks(outputs)
+        if isinstance(outputs, dict):
+            if "chunks" in outputs:
+                return self._normalize_retrieved_chunks(outputs["chunks"])
+            if "retrieved_chunks" in outputs:
+                return self._normalize_retrieved_chunks(outputs["retrieved_chunks"])
+            if "output" in outputs:
+                return self._normalize_retrieved_chunks(outputs["output"])
+            return self._normalize_retrieved_chunks(outputs.get("chunk_ids", []))
         return []
 
     def _normalize_retrieved_chunks(self, chunks: Any) -> List[Dict[str, Any]]:
@@ -34,15 +34,11 @@ class TokenLevelMRR(TokenLevelSpanMetric):
             logger.debug("Missing retrieved or ground truth chunks; returning 0.0")
             return 0.0
 
-        ground_truth_ranges = self._ranges_by_doc(ground_truth_chunk_ids)
-        if not ground_truth_ranges:
+        ground_truth_union_by_doc = self._ground_truth_unions(ground_truth_chunk_ids)
+        if not ground_truth_union_by_doc:
             logger.debug("No valid ground truth ranges; returning 0.0")
             return 0.0
 
-        ground_truth_union_by_doc = {
-            doc_id: self._union_ranges(ranges)
-            for doc_id, ranges in ground_truth_ranges.items()
-        }
         ground_truth_len_by_doc = {
             doc_id: self._sum_ranges(ranges)
             for doc_id, ranges in ground_truth_union_by_doc.items()
@@ -32,11 +32,11 @@ class TokenLevelPrecision(TokenLevelSpanMetric):
             logger.debug("No ground truth chunks provided; returning 0.0")
             return 0.0
 
-        ground_truth_ranges = self._ranges_by_doc(ground_truth_chunk_ids)
+        ground_truth_unions = self._ground_truth_unions(ground_truth_chunk_ids)
         retrieved_ranges = self._ranges_by_doc(retrieved_chunk_ids)
 
         _, total_retrieved_len, total_overlap_len = self._compute_lengths(
-            ground_truth_ranges, retrieved_ranges
+            ground_truth_unions, retrieved_ranges
         )
 
         if total_retrieved_len == 0:
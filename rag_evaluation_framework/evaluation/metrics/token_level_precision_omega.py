@@ -28,11 +28,11 @@ class TokenLevelPrecisionOmega(TokenLevelSpanMetric):
             logger.debug("Missing retrieved or ground truth chunks; returning 0.0")
             return 0.0
 
-        ground_truth_ranges = self._ranges_by_doc(ground_truth_chunk_ids)
+        ground_truth_unions = self._ground_truth_unions(ground_truth_chunk_ids)
         retrieved_ranges = self._ranges_by_doc(retrieved_chunk_ids)
 
         total_reference_len, total_retrieved_len, total_overlap_len = self._compute_lengths(
-            ground_truth_ranges, retrieved_ranges
+            ground_truth_unions, retrieved_ranges
         )
 
         missed_reference_len = max(total_reference_len - total_overlap_len, 0)
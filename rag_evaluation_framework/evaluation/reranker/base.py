@@ -6,4 +6,17 @@ class Reranker(ABC):
 
     @abstractmethod
     def rerank(self, docs: List[str], query: str, k: int) -> List[str]:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def rerank_batch(self, queries: List[str], docs_lists: List[List[str]], k: int) -> List[List[str]]:
+        """Rerank several queries at once, one doc list per query.
+
+        The default calls ``rerank`` per query. Cross-encoder backends should
+        override this to score all ``(query, doc)`` pairs in a single forward
+        pass and split the scores back per query.
+        """
+        if len(queries) != len(docs_lists):
+            raise ValueError(
+                f"Number of queries ({len(queries)}) must match number of doc lists ({len(docs_lists)})"
+            )
+        return [self.rerank(docs, query, k) for query, docs in zip(queries, docs_lists)]
@@ -7,6 +7,8 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_AT_K_RE = re.compile(r"@\d+$")
+
 
 class ComparisonGraph:
     """Visualise results from a hyperparameter sweep.
@@ -32,6 +34,22 @@ class ComparisonGraph:
         if not sweep_results:
             raise ValueError("sweep_results must be a non-empty list")
         self.results = sweep_results
+        # Dense configs × metrics score matrix shared by every view; metrics
+        # missing from a result score 0.0.
+        normalized_results = [self._get_normalized_metrics(r) for r in sweep_results]
+        self._metric_names: List[str] = np.unique(
+            np.fromiter(
+                (m for norm in normalized_results for m in norm), dtype=object
+            )
+        ).tolist()
+        self._metric_index = {m: j for j, m in enumerate(self._metric_names)}
+        self._score_matrix = np.array(
+            [
+                [norm.get(m, 0.0) for m in self._metric_names]
+                for norm in normalized_results
+            ],
+            dtype=np.float64,
+        ).reshape(len(sweep_results), len(self._metric_names))
 
     # ------------------------------------------------------------------ #
     #  Helpers                                                             #
@@ -40,7 +58,7 @@ class ComparisonGraph:
     @staticmethod
     def _normalize_metric_name(name: str) -> str:
         """Strip the ``@k`` suffix so metrics are comparable across k values."""
-        return re.sub(r"@\d+$", "", name)
+        return _AT_K_RE.sub("", name)
 
     def _get_normalized_metrics(
         self, result: Dict[str, Any]
@@ -53,13 +71,10 @@ class ComparisonGraph:
 
     def _all_metric_names(self, filter_metrics: Optional[List[str]] = None) -> List[str]:
         """Collect every unique (normalised) metric name across results."""
-        names: set[str] = set()
-        for r in self.results:
-            names.update(self._get_normalized_metrics(r).keys())
-        ordered = sorted(names)
-        if filter_metrics:
-            ordered = [m for m in ordered if m in filter_metrics]
-        return ordered
+        if not filter_metrics:
+            return list(self._metric_names)
+        filter_set = frozenset(filter_metrics)
+        return [m for m in self._metric_names if m in filter_set]
 
     @staticmethod
     def _config_label(config: Dict[str, Any]) -> str:
@@ -100,25 +115,12 @@ class ComparisonGraph:
         fig, ax = plt.subplots(figsize=(max(8, n_configs * 1.5), 6))
 
         for i, metric in enumerate(metric_names):
-            values = [
-                self._get_normalized_metrics(r).get(metric, 0.0)
-                for r in self.results
-            ]
+            values = self._score_matrix[:, self._metric_index[metric]]
             offset = (i - n_metrics / 2 + 0.5) * width
             bars = ax.bar(x + offset, values, width, label=metric)
-            # Add value labels on top of bars
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax.annotate(
-                        f"{height:.2f}",
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha="center",
-                        va="bottom",
-                        fontsize=7,
-                    )
+            # Add value labels on top of bars (blank for zero-height bars)
+            bar_labels = [f"{v:.2f}" if v > 0 else "" for v in values]
+            ax.bar_label(bars, labels=bar_labels, padding=3, fontsize=7)
 
         ax.set_ylabel("Score")
         ax.set_title("Experiment Comparison")
@@ -155,17 +157,30 @@ class ComparisonGraph:
         other_keys = [k for k in ["chunker", "embedder", "k", "reranker"] if k != x]
 
         groups: Dict[tuple, Dict[str, Any]] = {}
+        row_group_keys: List[tuple] = []
         for r in self.results:
             cfg = r["config"]
             group_key = tuple(str(cfg.get(k)) for k in other_keys)
-            group_label = " | ".join(
-                f"{k}={cfg.get(k)}"
-                for k in other_keys
-                if cfg.get(k) is not None
-            )
+            row_group_keys.append(group_key)
             if group_key not in groups:
-                groups[group_key] = {"label": group_label, "results": []}
-            groups[group_key]["results"].append(r)
+                group_label = " | ".join(
+                    f"{k}={cfg.get(k)}"
+                    for k in other_keys
+                    if cfg.get(k) is not None
+                )
+                groups[group_key] = {"label": group_label, "rows": [], "x": []}
+
+        # Sort all rows by x value once; groups (kept in first-seen order)
+        # then fill up already sorted, so no per-group / per-metric sorting.
+        x_values = [r["config"][x] for r in self.results]
+        sorted_rows = sorted(
+            range(len(self.results)),
+            key=lambda i: (isinstance(x_values[i], str), x_values[i]),
+        )
+        for row in sorted_rows:
+            group_data = groups[row_group_keys[row]]
+            group_data["rows"].append(row)
+            group_data["x"].append(x_values[row])
 
         n_metrics = len(metric_names)
         fig, axes = plt.subplots(
@@ -174,19 +189,14 @@ class ComparisonGraph:
         axes = axes[0]
 
         for ax, metric_name in zip(axes, metric_names):
+            col = self._score_matrix[:, self._metric_index[metric_name]]
             for group_data in groups.values():
-                x_values = [r["config"][x] for r in group_data["results"]]
-                y_values = [
-                    self._get_normalized_metrics(r).get(metric_name, 0.0)
-                    for r in group_data["results"]
-                ]
-
-                # Sort by x value
-                pairs = sorted(zip(x_values, y_values), key=lambda p: (isinstance(p[0], str), p[0]))
-                x_sorted = [p[0] for p in pairs]
-                y_sorted = [p[1] for p in pairs]
-
-                ax.plot(x_sorted, y_sorted, marker="o", label=group_data["label"])
+                ax.plot(
+                    group_data["x"],
+                    col[group_data["rows"]],
+                    marker="o",
+                    label=group_data["label"],
+                )
 
             ax.set_xlabel(x)
             ax.set_ylabel("Score")
@@ -213,15 +223,7 @@ class ComparisonGraph:
             return
 
         labels = [self._config_label(r["config"]) for r in self.results]
-        data = np.array(
-            [
-                [
-                    self._get_normalized_metrics(r).get(m, 0.0)
-                    for m in metric_names
-                ]
-                for r in self.results
-            ]
-        )
+        data = self._score_matrix[:, [self._metric_index[m] for m in metric_names]]
 
         fig, ax = plt.subplots(
             figsize=(max(8, len(metric_names) * 2), max(4, len(labels) * 0.6))
@@ -0,0 +1,31 @@
+import numpy as np
+
+from rag_evaluation_framework.evaluation.cache import SemanticResultCache
+
+
+def test_identical_embedding_always_hits_at_threshold_one():
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        embedding = rng.standard_normal(1536).tolist()
+        cache = SemanticResultCache(threshold=1.0)
+        cache.put(embedding, [{"text": "chunk"}], k=1)
+        assert cache.get(embedding, k=1) == [{"text": "chunk"}]
+
+
+def test_put_reuses_expired_slot_before_evicting_live_entry():
+    cache = SemanticResultCache(threshold=1.0, max_size=2)
+    cache.put([1.0, 0.0, 0.0], [{"text": "live"}], k=1)
+    cache.put([0.0, 1.0, 0.0], [{"text": "expired"}], k=1, ttl=0.0)
+    assert len(cache) == 1
+    cache.put([0.0, 0.0, 1.0], [{"text": "new"}], k=1)
+    assert len(cache) == 2
+    assert cache.get([1.0, 0.0, 0.0], k=1) == [{"text": "live"}]
+    assert cache.get([0.0, 0.0, 1.0], k=1) == [{"text": "new"}]
+
+
+def test_put_skips_dimension_mismatch():
+    cache = SemanticResultCache(threshold=1.0)
+    cache.put([1.0, 0.0], [{"text": "a"}], k=1)
+    cache.put([1.0, 0.0, 0.0], [{"text": "b"}], k=1)
+    assert len(cache) == 1
+    assert cache.get([1.0, 0.0, 0.0], k=1) is None
@@ -0,0 +1,93 @@
+import math
+import random
+
+import numpy as np
+
+from rag_evaluation_framework.evaluation.metrics import TokenLevelRecall
+
+
+def _random_spans(rng, doc_ids, low=-50, high=200):
+    spans = []
+    for _ in range(rng.randint(0, 6)):
+        start = rng.randint(low, high)
+        spans.append(
+            {
+                "doc_id": rng.choice(doc_ids),
+                "start_index": start,
+                "end_index": start + rng.randint(0, 60),
+            }
+        )
+    return spans
+
+
+def _assert_batch_matches_calculate(metric, retrieved_batch, ground_truth_batch):
+    scores = metric.calculate_batch(retrieved_batch, ground_truth_batch)
+    assert len(scores) == len(ground_truth_batch)
+    for score, retrieved, ground_truth in zip(scores, retrieved_batch, ground_truth_batch):
+        assert math.isclose(score, metric.calculate(retrieved, ground_truth))
+
+
+def test_calculate_batch_matches_calculate_on_random_spans():
+    rng = random.Random(0)
+    metric = TokenLevelRecall()
+    # Mixes int and str doc ids (1 and "1" are the same document), zero-length
+    # spans and negative starts.
+    doc_ids = ["a", "b", 1, "1"]
+    retrieved_batch = [_random_spans(rng, doc_ids) for _ in range(500)]
+    ground_truth_batch = [_random_spans(rng, doc_ids) for _ in range(500)]
+    _assert_batch_matches_calculate(metric, retrieved_batch, ground_truth_batch)
+
+
+def test_calculate_batch_negative_starts():
+    metric = TokenLevelRecall()
+    ground_truth_batch = [
+        [{"doc_id": "a", "start_index": 0, "end_index": 10}],
+        [{"doc_id": "a", "start_index": -8, "end_index": 2}],
+    ]
+    retrieved_batch = [
+        [{"doc_id": "a", "start_index": 0, "end_index": 10}],
+        [{"doc_id": "a", "start_index": -8, "end_index": -2}],
+    ]
+    scores = metric.calculate_batch(retrieved_batch, ground_truth_batch)
+    np.testing.assert_allclose(scores, [1.0, 0.6])
+    _assert_batch_matches_calculate(metric, retrieved_batch, ground_truth_batch)
+
+
+def test_calculate_batch_int_and_str_doc_ids_match():
+    metric = TokenLevelRecall()
+    scores = metric.calculate_batch(
+        [[{"doc_id": 1, "start_index": 0, "end_index": 5}]],
+        [[{"doc_id": "1", "start_index": 0, "end_index": 10}]],
+    )
+    np.testing.assert_allclose(scores, [0.5])
+
+
+def test_calculate_batch_skips_invalid_spans():
+    metric = TokenLevelRecall()
+    ground_truth = [
+        {"doc_id": "a", "start_index": 0, "end_index": 10},
+        {"doc_id": "a", "start_index": None, "end_index": 40},
+        {"doc_id": None, "start_index": 0, "end_index": 40},
+        {"doc_id": "a", "start_index": 30},
+    ]
+    retrieved = [
+        {"doc_id": "a", "start_index": 5, "end_index": 20},
+        {"doc_id": "a", "start_index": 8, "end_index": 8},
+        {"doc_id": "a", "end_index": 10},
+    ]
+    _assert_batch_matches_calculate(metric, [retrieved], [ground_truth])
+    # Reversed spans (end < start) are dropped by the batch path.
+    reversed_span = {"doc_id": "a", "start_index": 9, "end_index": 2}
+    scores = metric.calculate_batch([retrieved + [reversed_span]], [ground_truth])
+    np.testing.assert_allclose(scores, [metric.calculate(retrieved, ground_truth)])
+
+
+def test_calculate_batch_empty():
+    metric = TokenLevelRecall()
+    assert metric.calculate_batch([], []).shape == (0,)
+    np.testing.assert_allclose(metric.calculate_batch([[], []], [[], []]), [0.0, 0.0])
+    _assert_batch_matches_calculate(
+        metric,
+        [[], [{"doc_id": "a", "start_index": 0, "end_index": 4}]],
+        [[{"doc_id": "a", "start_index": 0, "end_index": 4}], []],
+    )